@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark hors ligne du crawler contre mock_poetica.py.
+
+Modes de crawl mesurés :
+- scrape  : main.scrape_all (menus → listings paginés → pages poèmes/thèmes)
+- content : json_content_filler.fill_content (une page par poème)
+
+Pour chaque mode : temps total, pages/s, octets, erreurs injectées, nouvelles
+tentatives, téléchargements en double, poèmes obtenus. Résultats en JSON.
+
+Exécution :
+  python bench_crawler.py --poems 500 --latency-ms 10 --error-rate 0.05
+  python bench_crawler.py --corpus poetica_poems.json --modes scrape
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Dict, List
+
+import main
+import perf
+import json_content_filler
+from generate_corpus import CorpusModel, DEFAULT_SEED
+from mock_poetica import MockPoeticaServer
+
+MODES = ("scrape", "content")
+
+
+def run_scrape(server: MockPoeticaServer, poems: List[Dict]) -> Dict:
+    fd, out = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    saved = (main.BASE_URL, main.OUTPUT_JSON)
+    main.BASE_URL, main.OUTPUT_JSON = server.base_url, out
+    try:
+        scraped = main.scrape_all()
+    finally:
+        main.BASE_URL, main.OUTPUT_JSON = saved
+        os.remove(out)
+    return {"poems": len(scraped), "with_themes": sum(1 for p in scraped if p.categories)}
+
+
+def run_content(server: MockPoeticaServer, poems: List[Dict]) -> Dict:
+    # mêmes poèmes, URLs réécrites vers le serveur local
+    local = [
+        dict(p, url=server.base_url + p["url"].split("://", 1)[-1].split("/", 1)[1])
+        for p in poems
+    ]
+    filled = json_content_filler.fill_content(local, delay=0)
+    return {"poems": len(filled), "with_content": sum(1 for p in filled if p["content"])}
+
+
+def bench_mode(mode: str, server: MockPoeticaServer, poems: List[Dict], verbose: bool) -> Dict:
+    server.stats.reset()
+    perf.reset()
+    runner = run_scrape if mode == "scrape" else run_content
+    sink = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+    t0 = time.perf_counter()
+    with sink:
+        result = runner(server, poems)
+    wall = time.perf_counter() - t0
+    stats = server.stats.as_dict()
+    return {
+        "mode": mode,
+        "wall_s": wall,
+        "pages_per_s": stats["requests"] / wall if wall else 0.0,
+        **stats,
+        **result,
+        "metrics": perf.snapshot(),  # vue client : fetch/parse/extraction
+    }
+
+
+def summary_count(run: Dict) -> str:
+    # le filler ne retente pas : une page en erreur donne un contenu vide
+    if run["mode"] == "content":
+        return f"{run['with_content']:6d}/{run['poems']} avec contenu"
+    return f"{run['with_themes']:6d}/{run['poems']} avec thèmes"
+
+
+def main_cli():
+    ap = argparse.ArgumentParser(description="Benchmark du crawler contre un faux poetica.fr.")
+    ap.add_argument("--corpus", help="corpus JSON servi (défaut : corpus synthétique)")
+    ap.add_argument("--poems", type=int, default=500, help="taille du corpus synthétique")
+    ap.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    ap.add_argument("--latency-ms", type=float, default=0.0)
+    ap.add_argument("--jitter-ms", type=float, default=0.0)
+    ap.add_argument("--error-rate", type=float, default=0.0)
+    ap.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    ap.add_argument("-o", "--output", default="bench_crawler_results.json")
+    ap.add_argument("-v", "--verbose", action="store_true", help="afficher la sortie du crawler")
+    args = ap.parse_args()
+
+    if args.corpus:
+        with open(args.corpus, "r", encoding="utf-8") as f:
+            poems = json.load(f)
+    else:
+        poems = list(CorpusModel.from_file().generate(args.poems, seed=args.seed))
+
+    # pas de politesse ni d'attente entre tentatives contre un serveur local
+    main.DELAY_BETWEEN_REQUESTS = 0
+    main.RETRY_BACKOFF = 0
+
+    runs: List[Dict] = []
+    with MockPoeticaServer(poems, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                           error_rate=args.error_rate, seed=args.seed) as server:
+        for mode in args.modes:
+            run = bench_mode(mode, server, poems, args.verbose)
+            runs.append(run)
+            print(
+                f"{mode:<8} {run['wall_s']:8.2f} s  {run['pages_per_s']:8.1f} pages/s  "
+                f"{run['requests']:6d} req  {run['bytes'] / 1e6:7.2f} Mo  "
+                f"{run['errors_injected']:4d} err  {run['retries']:4d} retries  "
+                f"{run['duplicates']:4d} doublons  {summary_count(run)}"
+            )
+
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "corpus": args.corpus or f"synthetic:{args.poems}",
+        "latency_ms": args.latency_ms,
+        "jitter_ms": args.jitter_ms,
+        "error_rate": args.error_rate,
+        "seed": args.seed,
+        "runs": runs,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"[INFO] Résultats écrits dans {args.output}")
+
+
+if __name__ == "__main__":
+    main_cli()
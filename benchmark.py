@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Banc d'essai des chemins chauds de main.py sur des corpus synthétiques.
+
+Mesure, pour chaque taille de corpus :
+- load_existing_data / save_data (JSON)
+- PoeticaApp._build_indices
+- filter_poems sur des requêtes typiques (titre, auteur, thèmes, combinées)
+- sort_poems sur chaque colonne triable
+- PoeticaApp._refresh_table contre un Tk masqué (ignoré si aucun affichage
+  n'est disponible, ex. serveur sans X ; lancer alors sous xvfb-run)
+
+Les résultats sont écrits en JSON pour pouvoir comparer deux exécutions.
+
+Exécution :
+  python benchmark.py 10k 100k -o bench_results.json
+  python benchmark.py --corpus corpus_1m.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import tempfile
+import time
+import tkinter as tk
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Optional
+
+import main
+from generate_corpus import CorpusModel, DEFAULT_SEED, parse_size, write_corpus
+
+DEFAULT_REPEAT = 5
+
+
+def timeit(fn: Callable[[], object], repeat: int) -> Dict[str, float]:
+    """Exécute `fn` `repeat` fois et retourne min/médiane/moyenne en secondes."""
+    samples: List[float] = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "repeat": repeat,
+    }
+
+
+def typical_queries(poems: List[main.Poem], by_author: Dict[str, List[main.Poem]]) -> Dict[str, Dict]:
+    """Requêtes représentatives : auteur le plus prolifique, thèmes fréquents."""
+    top_author = max(by_author, key=lambda a: len(by_author[a]))
+    counts: Dict[str, int] = {}
+    for p in poems:
+        for c in p.categories[1:]:
+            counts[c] = counts.get(c, 0) + 1
+    top_themes = sorted(counts, key=counts.get, reverse=True)[:2]
+    return {
+        "all": {"author": None, "q": "", "cats": []},
+        "title": {"author": None, "q": "amour", "cats": []},
+        "author": {"author": top_author, "q": "", "cats": []},
+        "themes": {"author": None, "q": "", "cats": top_themes},
+        "title+themes": {"author": None, "q": "la", "cats": top_themes},
+        "author+title": {"author": top_author, "q": "le", "cats": []},
+    }
+
+
+def bench_gui(poems: List[main.Poem], repeat: int) -> Dict:
+    try:
+        app = main.PoeticaApp(poems)
+    except tk.TclError as e:
+        return {"_refresh_table": {"skipped": f"Tk indisponible : {e}"}}
+    try:
+        app.root.withdraw()
+        results: Dict[str, Dict] = {}
+
+        def refresh():
+            app._refresh_table(animated=False)
+            app.root.update_idletasks()
+
+        results["_refresh_table"] = timeit(refresh, repeat)
+        app.search_var.set("amour")
+        results["_refresh_table[title]"] = timeit(refresh, repeat)
+        return results
+    finally:
+        app.root.destroy()
+
+
+def bench_corpus(path: str, repeat: int, gui: bool) -> Dict:
+    res: Dict[str, object] = {"corpus": path, "bytes": os.path.getsize(path)}
+    timings: Dict[str, Dict] = {}
+
+    timings["load_existing_data"] = timeit(lambda: main.load_existing_data(path), repeat)
+    poems = main.load_existing_data(path)
+    res["poems"] = len(poems)
+
+    holder = SimpleNamespace(poems=poems)
+    timings["_build_indices"] = timeit(lambda: main.PoeticaApp._build_indices(holder), repeat)
+    res["authors"] = len(holder.by_author)
+    res["themes"] = len(holder.by_theme)
+
+    for name, q in typical_queries(poems, holder.by_author).items():
+        base = poems if q["author"] is None else holder.by_author[q["author"]]
+        timings[f"filter_poems[{name}]"] = timeit(
+            lambda: main.filter_poems(base, q["q"], q["cats"]), repeat
+        )
+
+    for col, desc in (("comments", True), ("title", False), ("author", False)):
+        # on trie une copie : trier une liste déjà triée fausserait la mesure
+        timings[f"sort_poems[{col}]"] = timeit(
+            lambda: main.sort_poems(list(poems), col, desc), repeat
+        )
+
+    fd, out = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    try:
+        timings["save_data"] = timeit(lambda: main.save_data(poems, out), repeat)
+    finally:
+        os.remove(out)
+
+    if gui:
+        timings.update(bench_gui(poems, repeat))
+    res["timings"] = timings
+    return res
+
+
+def print_summary(run: Dict) -> None:
+    print(f"\n{run['corpus']} — {run['poems']} poèmes, {run['authors']} auteurs")
+    for name, t in run["timings"].items():
+        if "median" in t:
+            print(f"  {name:<32} {t['median'] * 1000:10.2f} ms")
+        else:
+            print(f"  {name:<32} {t}")
+
+
+def main_cli():
+    ap = argparse.ArgumentParser(description="Benchmark des chemins chauds de Poetica.")
+    ap.add_argument("sizes", nargs="*", help="tailles de corpus à générer (ex: 10k 100k 1M)")
+    ap.add_argument("--corpus", action="append", default=[], help="corpus JSON existant")
+    ap.add_argument("-o", "--output", default="bench_results.json")
+    ap.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    ap.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    ap.add_argument("--no-gui", action="store_true", help="ne pas mesurer _refresh_table")
+    args = ap.parse_args()
+
+    if not args.sizes and not args.corpus:
+        args.sizes = ["10k"]
+
+    runs: List[Dict] = []
+    model: Optional[CorpusModel] = CorpusModel.from_file() if args.sizes else None
+    tmpdir = tempfile.mkdtemp(prefix="poetica_bench_")
+    try:
+        for size in args.sizes:
+            path = os.path.join(tmpdir, f"corpus_{size.lower()}.json")
+            write_corpus(model.generate(parse_size(size), seed=args.seed), path)
+            run = bench_corpus(path, args.repeat, gui=not args.no_gui)
+            run["size"] = size
+            runs.append(run)
+            print_summary(run)
+            os.remove(path)  # 1M poèmes ≈ 200 Mo : ne pas les accumuler
+        for path in args.corpus:
+            run = bench_corpus(path, args.repeat, gui=not args.no_gui)
+            runs.append(run)
+            print_summary(run)
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "runs": runs,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n[INFO] Résultats écrits dans {args.output}")
+
+
+if __name__ == "__main__":
+    main_cli()
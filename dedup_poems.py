@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Détection des quasi‑doublons (poèmes republiés / retitrés sous une autre URL).
+
+Étape hors ligne à lancer après json_content_filler.py : lit le JSON enrichi du
+contenu, calcule une signature MinHash des shingles (n‑grammes de mots) de
+chaque texte, puis regroupe les candidats par LSH (bandes de la signature) en
+temps quasi linéaire au lieu de comparer toutes les paires. Les candidats
+dont la similarité estimée dépasse SIMILARITY_THRESHOLD sont réunis
+(union‑find) en clusters.
+
+Chaque poème d'un cluster de taille > 1 reçoit "dup_cluster" = clé (poeme-NNN)
+du poème le plus commenté du cluster ; les autres poèmes reçoivent None.
+Les clusters sont aussi écrits dans DUPLICATES_FILE ({poem_key: dup_cluster},
+poèmes en cluster seulement) : c'est ce petit fichier que l'application lit,
+sans charger les textes.
+L'application, si demandé, ne garde que le premier poème de chaque cluster
+dans ses résultats filtrés et triés (main.drop_duplicates).
+
+Exécution :
+  python dedup_poems.py [entrée.json] [sortie.json]
+"""
+import hashlib
+import json
+import random
+import re
+import sys
+import time
+import unicodedata
+
+from poem_keys import poem_key
+
+# -------------------
+# Configuration
+# -------------------
+INPUT_FILE = "poetica_poems_with_content.json"   # sortie de json_content_filler.py
+OUTPUT_FILE = INPUT_FILE                          # mis à jour sur place
+DUPLICATES_FILE = "poetica_duplicates.json"       # lu par main.py au chargement
+SHINGLE_SIZE = 3              # mots par shingle
+NUM_PERM = 128                # longueur de la signature MinHash
+BANDS = 16                    # BANDS × ROWS = NUM_PERM ; seuil LSH ≈ (1/BANDS)^(1/ROWS) ≈ 0.71
+ROWS = NUM_PERM // BANDS
+SIMILARITY_THRESHOLD = 0.8    # Jaccard estimé minimal pour confirmer un doublon
+SEED = 42
+
+# une « permutation » = hachage universel (a·h + b) mod p sur le hash 64 bits du
+# shingle, p premier de Mersenne ; a, b tirés de SEED
+_PRIME = (1 << 61) - 1
+_rng = random.Random(SEED)
+_PERMS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+
+
+# -------------------
+# MinHash
+# -------------------
+def shingles(text):
+    s = unicodedata.normalize("NFKD", text)
+    s = "".join(ch for ch in s if not unicodedata.combining(ch)).lower()
+    words = re.findall(r"\w+", s)
+    if not words:
+        return set()
+    if len(words) <= SHINGLE_SIZE:
+        return {" ".join(words)}
+    return {" ".join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)}
+
+
+def minhash(shingle_set):
+    hashes = [
+        int.from_bytes(hashlib.blake2b(sh.encode("utf-8"), digest_size=8).digest(), "little")
+        for sh in shingle_set
+    ]
+    p = _PRIME
+    return [min([(a * h + b) % p for h in hashes]) for a, b in _PERMS]
+
+
+def similarity(sig_a, sig_b):
+    return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / NUM_PERM
+
+
+# -------------------
+# Clustering
+# -------------------
+def find(parent, i):
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def find_clusters(signatures):
+    """signatures : liste (None si pas de contenu). Retourne parent[] (union‑find)."""
+    parent = list(range(len(signatures)))
+    buckets = {}
+    for i, sig in enumerate(signatures):
+        if sig is None:
+            continue
+        for b in range(BANDS):
+            buckets.setdefault((b, tuple(sig[b * ROWS:(b + 1) * ROWS])), []).append(i)
+
+    compared = set()
+    for members in buckets.values():
+        if len(members) < 2:
+            continue
+        # la similarité n'est pas transitive : chaque membre est comparé à tous
+        # les membres précédents du seau qui ne sont pas déjà dans son cluster
+        # (les seaux sont petits ; `compared` évite de refaire une paire vue
+        # dans une autre bande)
+        for k, j in enumerate(members[1:], start=1):
+            for i in members[:k]:
+                ri, rj = find(parent, i), find(parent, j)
+                if ri == rj:
+                    continue
+                pair = (i, j)
+                if pair in compared:
+                    continue
+                compared.add(pair)
+                if similarity(signatures[i], signatures[j]) >= SIMILARITY_THRESHOLD:
+                    parent[rj] = ri
+    return parent
+
+
+def assign_clusters(poems):
+    t0 = time.perf_counter()
+    signatures = []
+    for poem in poems:
+        sh = shingles(poem.get("content") or "")
+        signatures.append(minhash(sh) if sh else None)
+    t1 = time.perf_counter()
+
+    parent = find_clusters(signatures)
+    groups = {}
+    for i in range(len(poems)):
+        groups.setdefault(find(parent, i), []).append(i)
+
+    n_clusters = n_dups = 0
+    for members in groups.values():
+        if len(members) < 2:
+            poems[members[0]]["dup_cluster"] = None
+            continue
+        rep = max(members, key=lambda i: int(poems[i].get("comments", 0)))
+        cluster = poem_key(poems[rep]["url"])
+        for i in members:
+            poems[i]["dup_cluster"] = cluster
+        n_clusters += 1
+        n_dups += len(members) - 1
+    t2 = time.perf_counter()
+    print(f"MinHash : {t1 - t0:.1f} s, LSH + clusters : {t2 - t1:.1f} s")
+    return n_clusters, n_dups
+
+
+def main():
+    input_file = sys.argv[1] if len(sys.argv) > 1 else INPUT_FILE
+    output_file = sys.argv[2] if len(sys.argv) > 2 else OUTPUT_FILE
+
+    with open(input_file, "r", encoding="utf-8") as f:
+        poems = json.load(f)
+
+    n_clusters, n_dups = assign_clusters(poems)
+
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump(poems, f, ensure_ascii=False, indent=2)
+
+    duplicates = {
+        poem_key(p["url"]): p["dup_cluster"] for p in poems if p.get("dup_cluster")
+    }
+    with open(DUPLICATES_FILE, "w", encoding="utf-8") as f:
+        json.dump(duplicates, f, ensure_ascii=False, indent=2)
+
+    print(f"\n✅ {n_clusters} cluster(s) de doublons, {n_dups} poème(s) masquable(s) → {output_file}, {DUPLICATES_FILE}")
+
+
+if __name__ == "__main__":
+    main()
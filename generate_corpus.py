@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Générateur de corpus synthétiques au format poetica_poems.json.
+
+Les distributions (poèmes par auteur, nombre de thèmes par poème, fréquence des
+thèmes, nombre de commentaires, vocabulaire des titres) sont tirées du vrai
+fichier poetica_poems.json, puis mises à l'échelle : au‑delà du corpus réel, de
+nouveaux auteurs synthétiques sont créés avec un nombre de poèmes tiré de la
+distribution réelle, si bien que la forme des index (auteur→poèmes,
+thème→poèmes) reste réaliste à 10k, 100k ou 1M poèmes.
+
+Comme dans les données réelles, la première catégorie de chaque poème est le nom
+d'affichage de l'auteur (« Victor Hugo » pour l'auteur « HUGO Victor »).
+
+Exécution :
+  python generate_corpus.py 100000 -o corpus_100k.json
+  python generate_corpus.py 10k 100k 1M            # corpus_10k.json, …
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+from collections import Counter
+from typing import Dict, Iterator, List, Tuple
+
+SOURCE_JSON = "poetica_poems.json"
+DEFAULT_SEED = 0
+
+
+class CorpusModel:
+    """Distributions empiriques extraites d'un corpus réel."""
+
+    def __init__(self, raw: List[Dict]):
+        by_author: Dict[str, List[Dict]] = {}
+        for p in raw:
+            by_author.setdefault(p["author"], []).append(p)
+
+        # auteur -> nom d'affichage (première catégorie la plus fréquente)
+        self.authors: List[Tuple[str, str]] = []
+        for author, poems in by_author.items():
+            firsts = Counter(p["categories"][0] for p in poems if p.get("categories"))
+            display = firsts.most_common(1)[0][0] if firsts else author
+            self.authors.append((author, display))
+        self.poems_per_author: List[int] = [len(v) for v in by_author.values()]
+
+        displays = {d for _, d in self.authors}
+        themes = Counter(c for p in raw for c in p.get("categories", []) if c not in displays)
+        self.themes: List[str] = list(themes)
+        self.theme_weights: List[int] = [themes[t] for t in self.themes]
+        self.themes_per_poem: List[int] = [
+            sum(1 for c in p.get("categories", []) if c not in displays) for p in raw
+        ]
+        self.comments: List[int] = [int(p.get("comments", 0)) for p in raw]
+        self.title_words: List[str] = [w for p in raw for w in p["title"].split()]
+        self.title_lengths: List[int] = [max(1, len(p["title"].split())) for p in raw]
+
+    @classmethod
+    def from_file(cls, path: str = SOURCE_JSON) -> "CorpusModel":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def _author_plan(self, n: int, rng: random.Random) -> Iterator[Tuple[str, str, int]]:
+        """(auteur, nom d'affichage, nb de poèmes) jusqu'à totaliser n poèmes."""
+        total = 0
+        k = 0
+        pool = list(zip(self.authors, self.poems_per_author))
+        rng.shuffle(pool)
+        while total < n:
+            if k < len(pool):
+                (author, display), count = pool[k]
+            else:
+                # auteurs synthétiques une fois les réels épuisés
+                j = k - len(pool) + 1
+                author, display = f"AUTEUR{j} Synthétique", f"Synthétique Auteur{j}"
+                count = rng.choice(self.poems_per_author)
+            count = min(count, n - total)
+            yield author, display, count
+            total += count
+            k += 1
+
+    def generate(self, n: int, seed: int = DEFAULT_SEED) -> Iterator[Dict]:
+        rng = random.Random(seed)
+        poem_id = 1
+        for author, display, count in self._author_plan(n, rng):
+            for _ in range(count):
+                k = rng.choice(self.themes_per_poem)
+                themes: List[str] = []
+                for t in rng.choices(self.themes, weights=self.theme_weights, k=k):
+                    if t not in themes:
+                        themes.append(t)
+                words = rng.choices(self.title_words, k=rng.choice(self.title_lengths))
+                title = " ".join(words)
+                slug = "-".join(w.lower() for w in words if w.isalnum()) or "sans-titre"
+                yield {
+                    "title": title,
+                    "url": f"https://www.poetica.fr/poeme-{poem_id}/{slug}/",
+                    "comments": rng.choice(self.comments),
+                    "author": author,
+                    "categories": [display] + themes,
+                }
+                poem_id += 1
+
+
+def parse_size(s: str) -> int:
+    s = s.strip().lower().replace("_", "")
+    mult = 1
+    if s.endswith("k"):
+        mult, s = 1_000, s[:-1]
+    elif s.endswith("m"):
+        mult, s = 1_000_000, s[:-1]
+    return int(float(s) * mult)
+
+
+def write_corpus(poems: Iterator[Dict], path: str) -> int:
+    """Écrit le corpus en JSON (tableau) sans le matérialiser en mémoire."""
+    n = 0
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("[\n")
+        for p in poems:
+            if n:
+                f.write(",\n")
+            f.write(json.dumps(p, ensure_ascii=False))
+            n += 1
+        f.write("\n]\n")
+    return n
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Génère des corpus poetica synthétiques.")
+    ap.add_argument("sizes", nargs="+", help="tailles (ex: 10000, 100k, 1M)")
+    ap.add_argument("-o", "--output", help="fichier de sortie (une seule taille)")
+    ap.add_argument("--source", default=SOURCE_JSON, help="corpus réel de référence")
+    ap.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    args = ap.parse_args()
+
+    if args.output and len(args.sizes) > 1:
+        ap.error("--output n'est utilisable qu'avec une seule taille")
+
+    model = CorpusModel.from_file(args.source)
+    for size in args.sizes:
+        n = parse_size(size)
+        path = args.output or f"corpus_{size.lower()}.json"
+        written = write_corpus(model.generate(n, seed=args.seed), path)
+        print(f"[INFO] {written} poèmes écrits dans {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,12 @@
+import atexit
 import json
+import os
 import time
 import requests
 from bs4 import BeautifulSoup
 
+import perf
+
 # -------------------
 # Configuration
 # -------------------
@@ -13,15 +17,21 @@ DELAY_BETWEEN_REQUESTS = 0.1  # en secondes (politesse avec le site)
 # -------------------
 # Fonction pour extraire le texte du poème
 # -------------------
+@perf.timed("extract.content")
 def extract_poem_text(url):
+    perf.incr("http.requests")
     try:
-        r = requests.get(url, timeout=10)
+        with perf.timed("http.fetch"):
+            r = requests.get(url, timeout=10)
         r.raise_for_status()
     except Exception as e:
+        perf.incr("http.errors")
         print(f"❌ Erreur en récupérant {url} : {e}")
         return ""
+    perf.incr("http.bytes", len(r.content))
 
-    soup = BeautifulSoup(r.text, "html.parser")
+    with perf.timed("html.parse"):
+        soup = BeautifulSoup(r.text, "html.parser")
 
     # Sur poetica.fr, le contenu du poème est généralement dans un <div class="entry-content">
     entry_content = soup.find("div", class_="entry-content")
@@ -52,21 +62,35 @@ def extract_poem_text(url):
 # -------------------
 # Traitement
 # -------------------
-with open(INPUT_FILE, "r", encoding="utf-8") as f:
-    poems = json.load(f)
+def fill_content(poems, delay=DELAY_BETWEEN_REQUESTS):
+    updated_poems = []
+    for i, poem in enumerate(poems, start=1):
+        print(f"[{i}/{len(poems)}] Récupération du contenu pour : {poem['title']}")
+        content = extract_poem_text(poem["url"])
+        poem["content"] = content
+        updated_poems.append(poem)
+        time.sleep(delay)
+    return updated_poems
 
-updated_poems = []
-for i, poem in enumerate(poems, start=1):
-    print(f"[{i}/{len(poems)}] Récupération du contenu pour : {poem['title']}")
-    content = extract_poem_text(poem["url"])
-    poem["content"] = content
-    updated_poems.append(poem)
-    time.sleep(DELAY_BETWEEN_REQUESTS)
 
-# -------------------
-# Sauvegarde
-# -------------------
-with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-    json.dump(updated_poems, f, ensure_ascii=False, indent=2)
+def main():
+    metrics_path = os.environ.get("POETICA_METRICS")
+    if metrics_path:
+        atexit.register(perf.dump, metrics_path)
+
+    with open(INPUT_FILE, "r", encoding="utf-8") as f:
+        poems = json.load(f)
+
+    updated_poems = fill_content(poems)
+
+    # -------------------
+    # Sauvegarde
+    # -------------------
+    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
+        json.dump(updated_poems, f, ensure_ascii=False, indent=2)
+
+    print(f"\n✅ Fichier enrichi sauvegardé dans {OUTPUT_FILE}")
+
 
-print(f"\n✅ Fichier enrichi sauvegardé dans {OUTPUT_FILE}")
+if __name__ == "__main__":
+    main()
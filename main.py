@@ -13,11 +13,16 @@ Améliorations majeures vs version précédente :
   • Style moderne (thème ttk "clam", couleurs sobres, espacements généreux)
   • Animations d'apparition des résultats (fondu de surbrillance)
   • Table triable par clic sur l'entête (commentaires/titre/auteur)
-  • Boutons d'actions (ouvrir sélection, copier URL, exporter CSV)
+  • Boutons d'actions (ouvrir sélection, copier URL, exporter CSV/JSONL/Parquet)
+  • Export en flux depuis le résultat courant, hors du thread UI, avec progression
   • Panneau de filtres séparé : Auteur (combo) et Thèmes (cases à cocher)
   • Les noms d'auteurs sont EXCLUS des "catégories" (on n'affiche que les thèmes)
+- Mesures (module perf) :
+  • Durées filtre / tri / rendu affichées dans la barre d'état
+  • POETICA_METRICS=metrics.json : compteurs et histogrammes écrits à la sortie
+  • F12 (ou POETICA_PROFILE=fichier.prof) : profil cProfile d'un rafraîchissement
 
-Dépendances : requests, beautifulsoup4
+Dépendances : requests, beautifulsoup4 (optionnel : pyarrow pour l'export Parquet)
   pip install requests beautifulsoup4
 
 Exécution :
@@ -26,27 +31,37 @@ Exécution :
 Note :
 - Le scraping (si poetica_poems.json est absent) reste identique mais on
   filtre les catégories pour supprimer celles correspondant aux auteurs.
-- Si vous avez déjà un JSON généré par la version précédente et que des noms
-  d'auteurs s'y trouvent dans "categories", vous pouvez relancer un scrape
-  (ou utiliser l'option de nettoyage incluse ci‑dessous).
+- Au chargement, poetica_poems.json et poems.json sont fusionnés par identifiant
+  de poème (poeme-NNN), les variantes de noms d'auteurs ("HUGO Victor" /
+  "Victor Hugo") sont ramenées à une forme canonique via l'index
+  poetica_authors.json, et les noms d'auteurs sont retirés des "categories".
+- Quasi‑doublons : après json_content_filler.py, lancer dedup_poems.py
+  (MinHash + LSH) ; la case « Masquer les doublons » ne garde alors que le
+  poème le mieux classé de chaque cluster parmi les résultats affichés.
 """
 from __future__ import annotations
 
 import json
 import re
 import time
-from dataclasses import dataclass, asdict, field
-from typing import List, Dict, Optional, Tuple, Set
+import unicodedata
+from dataclasses import dataclass, field, fields
+from typing import Callable, Iterable, Iterator, List, Dict, Optional, Tuple, Set
 from urllib.parse import urljoin
 
 import requests
 from bs4 import BeautifulSoup
 
+import perf
+from poem_keys import norm_url, poem_key
+
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import webbrowser
 import os
 import csv
+import threading
+import atexit
 
 # ----------------------------- Configuration ----------------------------- #
 BASE_URL = "https://www.poetica.fr/"
@@ -58,8 +73,13 @@ HEADERS = {
 }
 REQUEST_TIMEOUT = 15
 DELAY_BETWEEN_REQUESTS = 1.0  # politesse
+FETCH_RETRIES = 2             # nouvelles tentatives sur erreur réseau / HTTP 5xx / 429
+RETRY_BACKOFF = 2.0           # attente (s) × numéro de tentative
 
 OUTPUT_JSON = "poetica_poems.json"
+EXTRA_JSON_FILES = ["poems.json"]          # autres jeux de données fusionnés au chargement
+DUPLICATES_JSON = "poetica_duplicates.json"  # {poem_key: dup_cluster}, écrit par dedup_poems.py
+AUTHORS_JSON = "poetica_authors.json"      # index précalculé des identités d'auteurs
 CACHE_INTERMEDIATE_EVERY = 100  # sauvegarde intermédiaire toutes les N entrées
 
 # Pour tester rapidement, fixez un plafond (None pour illimité)
@@ -79,6 +99,13 @@ ANIMATION_DELAY_MS = 30   # délai entre étapes
 
 DEBOUNCE_MS = 180         # délai de debouncing pour recherche/filtre
 
+PROFILE_PATH = "poetica_refresh.prof"  # profil cProfile écrit par F12
+
+EXPORT_BATCH = 10_000     # lignes par lot (progression, groupes de lignes Parquet)
+EXPORT_POLL_MS = 100      # fréquence de mise à jour de la progression d'export
+EXPORT_COLUMNS = ("comments", "title", "author", "categories", "url")
+EXPORT_HEADERS = ("Commentaires", "Titre", "Auteur", "Thèmes", "URL")
+
 # ------------------------------- Data Model ------------------------------ #
 @dataclass
 class Poem:
@@ -87,36 +114,224 @@ class Poem:
     comments: int
     author: str
     categories: List[str]
+    # clé du représentant de son cluster de quasi-doublons (dedup_poems.py), sinon None
+    dup_cluster: Optional[str] = None
     # champs dérivés pour accélérer les filtres
     title_lc: str = field(init=False)
 
     def __post_init__(self):
         self.title_lc = self.title.lower()
 
-# ---------------------------- Utility Functions -------------------------- #
 
-def norm_url(u: str) -> str:
-    if not u:
-        return ""
-    u = u.strip()
-    if not u:
-        return ""
-    # retirer slash final et forcer minuscule
-    return u[:-1].lower() if u.endswith('/') else u.lower()
+def poem_from_dict(d: Dict) -> Poem:
+    """Construit un Poem en ignorant les clés inconnues (ex. "content") et en
+    tolérant les champs absents (poems.json n'a pas de catégories)."""
+    return Poem(
+        title=d["title"],
+        url=d["url"],
+        comments=int(d.get("comments", 0)),
+        author=d.get("author", ""),
+        categories=list(d.get("categories", [])),
+        dup_cluster=d.get("dup_cluster"),
+    )
 
 
-def get_soup(url: str) -> Optional[BeautifulSoup]:
+def poem_to_dict(p: Poem) -> Dict:
+    """Champs persistés uniquement (les champs dérivés init=False sont exclus)."""
+    return {f.name: getattr(p, f.name) for f in fields(p) if f.init}
+
+# ------------------------ Identité auteurs / poèmes ----------------------- #
+
+def author_key(name: str) -> str:
+    """Forme normalisée d'un nom d'auteur, indépendante de l'ordre des mots,
+    de la casse, des accents et de la ponctuation :
+    "HUGO Victor", "Victor Hugo" -> "hugo victor" ;
+    "LA FONTAINE (de) Jean", "Jean de La Fontaine" -> "de fontaine jean la".
+    """
+    s = unicodedata.normalize("NFKD", name)
+    s = "".join(ch for ch in s if not unicodedata.combining(ch)).lower()
+    return " ".join(sorted(re.findall(r"[a-z0-9]+", s)))
+
+
+class AuthorIndex:
+    """Associe variantes de noms et URLs d'auteurs à un identifiant unique.
+
+    Le nom canonique d'un auteur est la première variante rencontrée (on charge
+    poetica_poems.json en premier, donc la forme "NOM Prénom" du site).
+    """
+
+    def __init__(self):
+        self.names: List[str] = []           # id -> nom canonique
+        self.by_key: Dict[str, int] = {}     # author_key(variante) -> id
+        self.by_url: Dict[str, int] = {}     # norm_url(page auteur) -> id
+        self.dirty = False                   # modifié depuis le chargement
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def resolve(self, name: str = "", url: str = "") -> Optional[int]:
+        if url:
+            aid = self.by_url.get(norm_url(url))
+            if aid is not None:
+                return aid
+        if name:
+            return self.by_key.get(author_key(name))
+        return None
+
+    def add(self, name: str, url: str = "") -> Optional[int]:
+        """Enregistre une variante (et son URL) ; None si rien d'identifiable
+        (nom vide ou sans lettres, sans URL)."""
+        if not author_key(name) and not norm_url(url):
+            return None
+        aid = self.resolve(name, url)
+        if aid is None:
+            aid = len(self.names)
+            self.names.append(name)
+            self.dirty = True
+        k = author_key(name)
+        if k and k not in self.by_key:
+            self.by_key[k] = aid
+            self.dirty = True
+        u = norm_url(url)
+        if u and u not in self.by_url:
+            self.by_url[u] = aid
+            self.dirty = True
+        return aid
+
+    def canonical(self, name: str) -> str:
+        aid = self.resolve(name)
+        return name if aid is None else self.names[aid]
+
+    def is_author(self, name: str) -> bool:
+        return author_key(name) in self.by_key
+
+    def save(self, path: str = AUTHORS_JSON) -> None:
+        entries = [{"id": i, "name": n, "keys": [], "urls": []} for i, n in enumerate(self.names)]
+        for k, aid in self.by_key.items():
+            entries[aid]["keys"].append(k)
+        for u, aid in self.by_url.items():
+            entries[aid]["urls"].append(u)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(entries, f, ensure_ascii=False, indent=2)
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path: str = AUTHORS_JSON) -> "AuthorIndex":
+        index = cls()
+        if not os.path.exists(path):
+            return index
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+            for e in entries:
+                aid = len(index.names)
+                index.names.append(e["name"])
+                for k in e.get("keys", []):
+                    index.by_key.setdefault(k, aid)
+                for u in e.get("urls", []):
+                    index.by_url.setdefault(u, aid)
+        except Exception as e:
+            print(f"[WARN] Unable to load author index: {e}")
+            return cls()
+        return index
+
+
+def merge_poems(sources: Iterable[List[Poem]]) -> List[Poem]:
+    """Fusionne plusieurs listes en dédupliquant par poem_key (temps linéaire).
+    La première occurrence l'emporte ; ses champs vides sont complétés par les
+    suivantes (ex. catégories absentes de poems.json)."""
+    merged: Dict[str, Poem] = {}
+    for poems in sources:
+        for p in poems:
+            k = poem_key(p.url)
+            cur = merged.get(k)
+            if cur is None:
+                merged[k] = p
+                continue
+            if not cur.categories and p.categories:
+                cur.categories = list(p.categories)
+            if cur.dup_cluster is None and p.dup_cluster is not None:
+                cur.dup_cluster = p.dup_cluster
+    return list(merged.values())
+
+
+def load_duplicates(path: str = DUPLICATES_JSON) -> Dict[str, str]:
+    """Table poem_key -> dup_cluster produite par dedup_poems.py (vide si absente)."""
+    if not os.path.exists(path):
+        return {}
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=REQUEST_TIMEOUT)
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"[WARN] Unable to load duplicates: {e}")
+        return {}
+
+
+def apply_duplicates(poems: List[Poem], dups: Dict[str, str]) -> None:
+    if not dups:
+        return
+    for p in poems:
+        c = dups.get(poem_key(p.url))
+        if c is not None:
+            p.dup_cluster = c
+
+
+def clean_poems(poems: List[Poem], index: AuthorIndex) -> None:
+    """Passe de nettoyage au chargement : enregistre chaque auteur dans l'index,
+    ramène son nom à la forme canonique et retire des catégories les noms
+    d'auteurs (poetica les y met, ex. "Victor Hugo")."""
+    canonical: Dict[str, str] = {}
+    for p in poems:
+        if p.author not in canonical:
+            if p.author:
+                index.add(p.author)
+            canonical[p.author] = ""
+    # peu de noms distincts par rapport au nombre de poèmes : on mémorise
+    canonical = {a: index.canonical(a) for a in canonical}
+    is_author: Dict[str, bool] = {}
+    for p in poems:
+        p.author = canonical[p.author]
+        cats = []
+        for c in p.categories:
+            flag = is_author.get(c)
+            if flag is None:
+                flag = is_author[c] = index.is_author(c)
+            if not flag:
+                cats.append(c)
+        p.categories = cats
+
+
+# ---------------------------- Utility Functions -------------------------- #
+
+def get_soup(url: str) -> Optional[BeautifulSoup]:
+    for attempt in range(FETCH_RETRIES + 1):
+        if attempt:
+            perf.incr("http.retries")
+            time.sleep(RETRY_BACKOFF * attempt)
+        perf.incr("http.requests")
+        try:
+            with perf.timed("http.fetch"):
+                resp = requests.get(url, headers=HEADERS, timeout=REQUEST_TIMEOUT)
+        except requests.RequestException as e:
+            perf.incr("http.errors")
+            print(f"[ERROR] {e} for {url}")
+            continue
+        perf.incr("http.bytes", len(resp.content))
+        if resp.status_code >= 500 or resp.status_code == 429:
+            # erreur transitoire : on retente
+            perf.incr("http.errors")
+            print(f"[WARN] HTTP {resp.status_code} for {url}")
+            continue
         if resp.status_code != 200:
+            perf.incr("http.errors")
             print(f"[WARN] HTTP {resp.status_code} for {url}")
             return None
-        return BeautifulSoup(resp.text, "html.parser")
-    except requests.RequestException as e:
-        print(f"[ERROR] {e} for {url}")
-        return None
+        with perf.timed("html.parse"):
+            return BeautifulSoup(resp.text, "html.parser")
+    return None
 
 
+@perf.timed("extract.menus")
 def extract_menus(start_url: str = BASE_URL) -> Tuple[List[Dict], List[Dict]]:
     """Retourne (auteurs, categories) depuis les menus.
     Chaque élément est {"name": str, "url": str}.
@@ -154,6 +369,7 @@ def parse_comments_from_article(article: BeautifulSoup) -> int:
     return 0
 
 
+@perf.timed("extract.listing")
 def extract_poems_from_listing(listing_url: str) -> List[Dict]:
     soup = get_soup(listing_url)
     if soup is None:
@@ -210,6 +426,7 @@ def fetch_poems_for_author(author_name: str, author_url: str, max_poems: Optiona
     return collected
 
 
+@perf.timed("extract.themes")
 def fetch_poem_themes(poem_url: str, author_urls_norm: Set[str]) -> List[str]:
     """Extrait les thèmes (catégories hors auteurs) depuis la page du poème.
     On exclut toute catégorie dont l'URL normalisée appartient au set des URLs auteurs.
@@ -241,28 +458,164 @@ def fetch_poem_themes(poem_url: str, author_urls_norm: Set[str]) -> List[str]:
     return themes
 
 
+@perf.timed("io.load")
 def load_existing_data(path: str = OUTPUT_JSON) -> List[Poem]:
     if not os.path.exists(path):
         return []
     try:
         with open(path, "r", encoding="utf-8") as f:
             raw = json.load(f)
-        poems = [Poem(**p) for p in raw]
+        poems = [poem_from_dict(p) for p in raw]
         return poems
     except Exception as e:
         print(f"[WARN] Unable to load existing data: {e}")
         return []
 
 
+@perf.timed("io.save")
 def save_data(poems: List[Poem], path: str = OUTPUT_JSON) -> None:
-    data = [asdict(p) for p in poems]
+    data = [poem_to_dict(p) for p in poems]
     with open(path, "w", encoding="utf-8") as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
 
 
+# ------------------------------ Filtre / tri ------------------------------ #
+
+@perf.timed("filter")
+def filter_poems(base: List[Poem], q: str, active_cats: List[str]) -> List[Poem]:
+    """Filtre `base` par sous-chaîne du titre (`q` déjà en minuscule) et thèmes.
+    Retourne toujours une nouvelle liste.
+    """
+    res: List[Poem] = []
+    if q:
+        if active_cats:
+            for p in base:
+                if q in p.title_lc and any(c in p.categories for c in active_cats):
+                    res.append(p)
+        else:
+            for p in base:
+                if q in p.title_lc:
+                    res.append(p)
+    else:
+        if active_cats:
+            for p in base:
+                if any(c in p.categories for c in active_cats):
+                    res.append(p)
+        else:
+            res = list(base)
+    return res
+
+
+def drop_duplicates(data: List[Poem]) -> List[Poem]:
+    """Ne garde que le premier poème de chaque cluster de quasi-doublons
+    (dup_cluster) ; les poèmes sans cluster passent toujours. À appliquer
+    après filtre et tri : le poème conservé est le mieux classé de la vue
+    courante, même si le représentant global du cluster a été filtré."""
+    seen: Set[str] = set()
+    res: List[Poem] = []
+    for p in data:
+        c = p.dup_cluster
+        if c is not None:
+            if c in seen:
+                continue
+            seen.add(c)
+        res.append(p)
+    return res
+
+
+@perf.timed("sort")
+def sort_poems(data: List[Poem], col: str, desc: bool) -> None:
+    """Tri en place selon la colonne de la table (comments/title/author)."""
+    if col == "comments":
+        data.sort(key=lambda x: x.comments, reverse=desc)
+    elif col == "title":
+        data.sort(key=lambda x: x.title_lc, reverse=desc)
+    elif col == "author":
+        data.sort(key=lambda x: x.author.lower(), reverse=desc)
+
+
+# ------------------------------- Export ---------------------------------- #
+
+def iter_export_rows(poems: Iterable[Poem]) -> Iterator[Tuple[int, str, str, List[str], str]]:
+    """Génère les lignes d'export (ordre de EXPORT_COLUMNS) sans rien matérialiser.
+    Les thèmes restent une liste ; seul le CSV les aplatit en texte."""
+    for p in poems:
+        yield (p.comments, p.title, p.author, p.categories, p.url)
+
+
+def export_format_for(path: str) -> str:
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".jsonl", ".ndjson"):
+        return "jsonl"
+    if ext in (".parquet", ".pq"):
+        return "parquet"
+    return "csv"
+
+
+def _batched(rows: Iterable[tuple], size: int) -> Iterator[List[tuple]]:
+    batch: List[tuple] = []
+    for r in rows:
+        batch.append(r)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def export_rows(rows: Iterable[tuple], path: str, fmt: str = "csv",
+                progress: Optional[Callable[[int], None]] = None) -> int:
+    """Écrit `rows` dans `path` par lots de EXPORT_BATCH lignes (mémoire constante).
+
+    Formats : "csv", "jsonl" et "parquet" (colonnaire, nécessite pyarrow).
+    Les thèmes sont une liste en JSONL et Parquet, « a, b » en CSV.
+    `progress` reçoit le nombre de lignes écrites après chaque lot.
+    Retourne le nombre total de lignes écrites.
+    """
+    n = 0
+    if fmt == "parquet":
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise RuntimeError("L'export Parquet nécessite pyarrow (pip install pyarrow)")
+        schema = pa.schema([
+            ("comments", pa.int64()), ("title", pa.string()), ("author", pa.string()),
+            ("categories", pa.list_(pa.string())), ("url", pa.string()),
+        ])
+        with pq.ParquetWriter(path, schema) as writer:
+            for batch in _batched(rows, EXPORT_BATCH):
+                cols = [list(c) for c in zip(*batch)]
+                writer.write_table(pa.Table.from_arrays(cols, schema=schema))
+                n += len(batch)
+                if progress:
+                    progress(n)
+        return n
+
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        if fmt == "jsonl":
+            for batch in _batched(rows, EXPORT_BATCH):
+                f.writelines(
+                    json.dumps(dict(zip(EXPORT_COLUMNS, r)), ensure_ascii=False) + "\n"
+                    for r in batch
+                )
+                n += len(batch)
+                if progress:
+                    progress(n)
+        else:
+            w = csv.writer(f)
+            w.writerow(EXPORT_HEADERS)
+            for batch in _batched(rows, EXPORT_BATCH):
+                w.writerows((c, t, a, ", ".join(cats), u) for c, t, a, cats, u in batch)
+                n += len(batch)
+                if progress:
+                    progress(n)
+    return n
+
+
 # ------------------------------- Scraper --------------------------------- #
 
-def scrape_all() -> List[Poem]:
+def scrape_all(index: Optional[AuthorIndex] = None) -> List[Poem]:
     print("[INFO] Extraction des menus (auteurs & catégories)…")
     authors, _site_categories = extract_menus(BASE_URL)
     if not authors:
@@ -273,9 +626,12 @@ def scrape_all() -> List[Poem]:
         authors = authors[: MAX_AUTHORS]
 
     author_urls_norm: Set[str] = {norm_url(a["url"]) for a in authors}
+    if index is not None:
+        for a in authors:
+            index.add(a["name"], a["url"])
 
     poems: List[Poem] = []
-    seen_poem_urls: set[str] = set()
+    seen_poem_keys: set[str] = set()
 
     count_auth = 0
     for author in authors:
@@ -290,9 +646,10 @@ def scrape_all() -> List[Poem]:
 
         for i, p in enumerate(listing_poems, 1):
             p_url = p["url"]
-            if p_url in seen_poem_urls:
+            k = poem_key(p_url)
+            if k in seen_poem_keys:
                 continue
-            seen_poem_urls.add(p_url)
+            seen_poem_keys.add(k)
 
             themes = fetch_poem_themes(p_url, author_urls_norm)
             poem = Poem(
@@ -303,6 +660,7 @@ def scrape_all() -> List[Poem]:
                 categories=themes,
             )
             poems.append(poem)
+            perf.incr("scrape.poems")
 
             if len(poems) % CACHE_INTERMEDIATE_EVERY == 0:
                 print(f"[INFO] Sauvegarde intermédiaire ({len(poems)} poèmes)…")
@@ -357,10 +715,18 @@ class PoeticaApp:
         # état pour debouncing
         self._refresh_job: Optional[str] = None
         self._current_sort = ("comments", True)  # (col, desc)
+        # résultat courant (filtré + trié), source de vérité pour l'export
+        self._results: List[Poem] = []
+        self._export_thread: Optional[threading.Thread] = None
+        self._export_done = 0
+        self._export_error: Optional[Exception] = None
+        # profilage cProfile du prochain rafraîchissement (None = désactivé)
+        self._profile_path: Optional[str] = os.environ.get("POETICA_PROFILE") or None
         
         self._populate()
 
     # --- Data indices / caches --- #
+    @perf.timed("index.build")
     def _build_indices(self):
         self.by_author: Dict[str, List[Poem]] = {}
         self.by_theme: Dict[str, List[Poem]] = {}
@@ -424,6 +790,11 @@ class PoeticaApp:
         self.search_entry = ttk.Entry(middle, textvariable=self.search_var, width=40)
         self.search_entry.pack(anchor="w", pady=4, fill="x")
         self.search_entry.bind("<KeyRelease>", self._on_filters_changed)
+        self.hide_dups_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            middle, text="Masquer les doublons", variable=self.hide_dups_var,
+            command=self._on_filters_changed,
+        ).pack(anchor="w")
 
         # Actions
         right = ttk.Frame(filters)
@@ -431,7 +802,7 @@ class PoeticaApp:
         ttk.Button(right, text="Réinitialiser", command=self._reset_filters, style="Accent.TButton").pack(side="left", padx=6)
         ttk.Button(right, text="Ouvrir sélection", command=self._open_selected).pack(side="left", padx=6)
         ttk.Button(right, text="Copier URL", command=self._copy_selected_url).pack(side="left", padx=6)
-        ttk.Button(right, text="Exporter CSV", command=self._export_csv).pack(side="left", padx=6)
+        ttk.Button(right, text="Exporter…", command=self._export).pack(side="left", padx=6)
 
         # Panneau Thèmes (checklist)
         side = ttk.Frame(self.root)
@@ -469,11 +840,16 @@ class PoeticaApp:
         vsb.pack(side="right", fill="y")
 
         self.tree.bind("<Double-1>", self._on_double_click)
+        self.root.bind("<F12>", self._profile_next_refresh)
 
         # Status bar
         self.status = tk.StringVar(value="Prêt.")
         sb = ttk.Label(self.root, textvariable=self.status, anchor="w", style="Muted.TLabel")
         sb.pack(side="bottom", fill="x", padx=20, pady=(0,8))
+        self._status_label = sb
+        # barre de progression (affichée uniquement pendant un export,
+        # juste au‑dessus de la barre d'état)
+        self.progress = ttk.Progressbar(self.root, mode="determinate")
 
         # Initialisation du panneau de thèmes
         self._refresh_category_panel()
@@ -547,6 +923,7 @@ class PoeticaApp:
     def _reset_filters(self):
         self.author_var.set("Tous les auteurs")
         self.search_var.set("")
+        self.hide_dups_var.set(False)
         self._refresh_category_panel(update_only=False)
         self._refresh_table(animated=True)
 
@@ -575,25 +952,55 @@ class PoeticaApp:
         self.root.clipboard_append("\n".join(urls))
         self.status.set(f"URL copiée ({len(urls)})")
 
-    def _export_csv(self):
-        path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV", "*.csv")])
+    def _export(self):
+        if self._export_thread is not None and self._export_thread.is_alive():
+            self.status.set("Export déjà en cours…")
+            return
+        path = filedialog.asksaveasfilename(
+            defaultextension=".csv",
+            filetypes=[("CSV", "*.csv"), ("JSON Lines", "*.jsonl"), ("Parquet", "*.parquet")],
+        )
         if not path:
             return
-        # exporter les lignes actuellement visibles
-        rows = []
-        for iid in self.tree.get_children():
-            rows.append([
-                self.tree.set(iid, "comments"),
-                self.tree.set(iid, "title"),
-                self.tree.set(iid, "author"),
-                self.tree.set(iid, "categories"),
-                self.tree.set(iid, "url"),
-            ])
-        with open(path, "w", newline="", encoding="utf-8") as f:
-            w = csv.writer(f)
-            w.writerow(["Commentaires", "Titre", "Auteur", "Thèmes", "URL"])
-            w.writerows(rows)
-        self.status.set(f"Exporté → {path}")
+        fmt = export_format_for(path)
+        # on exporte le résultat courant (modèle), pas les cellules du Treeview :
+        # _refresh_table remplace la liste à chaque rafraîchissement, la référence
+        # capturée ici reste donc stable pendant toute la durée de l'export.
+        results = self._results
+        total = len(results)
+        self._export_done = 0
+        self._export_error = None
+        self.progress.configure(maximum=max(total, 1), value=0)
+        self.progress.pack(side="bottom", fill="x", padx=20, pady=(0, 4), after=self._status_label)
+
+        def on_progress(n: int):
+            self._export_done = n
+
+        def worker():
+            try:
+                export_rows(iter_export_rows(results), path, fmt, progress=on_progress)
+            except Exception as e:
+                self._export_error = e
+
+        self._export_thread = threading.Thread(target=worker, daemon=True)
+        self._export_thread.start()
+        self._poll_export(path, total)
+
+    def _poll_export(self, path: str, total: int):
+        # Tk n'est pas thread-safe : le worker ne touche qu'à des entiers, l'UI
+        # vient les lire périodiquement.
+        self.progress.configure(value=self._export_done)
+        if self._export_thread is not None and self._export_thread.is_alive():
+            self.status.set(f"Export… {self._export_done}/{total}")
+            self.root.after(EXPORT_POLL_MS, lambda: self._poll_export(path, total))
+            return
+        self._export_thread = None
+        self.progress.pack_forget()
+        if self._export_error is not None:
+            self.status.set("Échec de l'export.")
+            messagebox.showerror("Export", str(self._export_error))
+        else:
+            self.status.set(f"Exporté ({total}) → {path}")
 
     # --- Tri --- #
     def _sort_by(self, col: str):
@@ -617,55 +1024,56 @@ class PoeticaApp:
         else:
             base = self.by_author.get(author, [])
 
-        res: List[Poem] = []
-        if q:
-            if active_cats:
-                for p in base:
-                    if q in p.title_lc and any(c in p.categories for c in active_cats):
-                        res.append(p)
-            else:
-                for p in base:
-                    if q in p.title_lc:
-                        res.append(p)
-        else:
-            if active_cats:
-                for p in base:
-                    if any(c in p.categories for c in active_cats):
-                        res.append(p)
-            else:
-                res = list(base)
-        return res
+        return filter_poems(base, q, active_cats)
 
     def _refresh_table(self, animated: bool):
+        if self._profile_path:
+            # profil d'un seul rafraîchissement (F12 ou POETICA_PROFILE)
+            path, self._profile_path = self._profile_path, None
+            with perf.profiled(path):
+                self._do_refresh_table(animated)
+            self.status.set(self.status.get() + f" – profil → {path}")
+            return
+        self._do_refresh_table(animated)
+
+    def _profile_next_refresh(self, *_):
+        self._profile_path = PROFILE_PATH
+        self._refresh_table(animated=False)
+
+    @perf.timed("refresh")
+    def _do_refresh_table(self, animated: bool):
         data = self._filter_poems()
 
         col, desc = self._current_sort
-        if col == "comments":
-            data.sort(key=lambda x: x.comments, reverse=desc)
-        elif col == "title":
-            data.sort(key=lambda x: x.title_lc, reverse=desc)
-        elif col == "author":
-            data.sort(key=lambda x: x.author.lower(), reverse=desc)
+        sort_poems(data, col, desc)
+        if self.hide_dups_var.get():
+            data = drop_duplicates(data)
+        self._results = data
 
         # Clear table
         self.tree.delete(*self.tree.get_children())
 
         # Insert avec zébrage et marquage pour animation
         to_animate = []
-        for i, p in enumerate(data):
-            cats = ", ".join(p.categories)
-            iid = self.tree.insert("", "end", values=(p.comments, p.title, p.author, cats, p.url))
-            tag = "odd" if i % 2 else "even"
-            self.tree.item(iid, tags=(tag,))
-            if i < ANIMATION_ROWS:
-                to_animate.append(iid)
+        with perf.timed("tk.insert"):
+            for i, p in enumerate(data):
+                cats = ", ".join(p.categories)
+                iid = self.tree.insert("", "end", values=(p.comments, p.title, p.author, cats, p.url))
+                tag = "odd" if i % 2 else "even"
+                self.tree.item(iid, tags=(tag,))
+                if i < ANIMATION_ROWS:
+                    to_animate.append(iid)
 
         # Styles de lignes
         self.tree.tag_configure("even", background="white")
         self.tree.tag_configure("odd", background="#FBFBFE")
         self.tree.tag_configure("hilite", background=ROW_HILITE)
 
-        self.status.set(f"{len(data)} poème(s) – Auteur: {self._get_active_author() or 'Tous'} – Thèmes actifs: {len(self._active_categories())}")
+        self.status.set(
+            f"{len(data)} poème(s) – Auteur: {self._get_active_author() or 'Tous'} – Thèmes actifs: {len(self._active_categories())}"
+            f" – filtre {perf.last_ms('filter'):.1f} ms / tri {perf.last_ms('sort'):.1f} ms"
+            f" / rendu {perf.last_ms('tk.insert'):.1f} ms"
+        )
 
         if animated and to_animate:
             self._animate_rows(to_animate)
@@ -702,20 +1110,31 @@ class PoeticaApp:
 # --------------------------- Entry Point --------------------------------- #
 
 def load_or_scrape() -> List[Poem]:
+    index = AuthorIndex.load(AUTHORS_JSON)
     poems = load_existing_data(OUTPUT_JSON)
     if poems:
         print(f"[INFO] {len(poems)} poèmes chargés depuis {OUTPUT_JSON}")
-        # nettoyage préventif : si des auteurs se trouvent dans categories, on ne peut
-        # pas les distinguer ici sans les URLs ; on laisse tel quel. Un re‑scrape fera le tri.
-        return poems
-    # Sinon on scrape tout
-    poems = scrape_all()
-    if not poems:
-        messagebox.showerror("Erreur", "Impossible de récupérer des données depuis poetica.fr")
+    else:
+        # Sinon on scrape tout
+        poems = scrape_all(index)
+        if not poems:
+            messagebox.showerror("Erreur", "Impossible de récupérer des données depuis poetica.fr")
+            return poems
+    # fusion des autres jeux de données + nettoyage auteurs/catégories
+    extras = [load_existing_data(path) for path in EXTRA_JSON_FILES]
+    poems = merge_poems([poems] + extras)
+    apply_duplicates(poems, load_duplicates(DUPLICATES_JSON))
+    clean_poems(poems, index)
+    if index.dirty:
+        index.save(AUTHORS_JSON)
+    print(f"[INFO] {len(poems)} poèmes après fusion, {len(index)} auteurs")
     return poems
 
 
 def main():
+    metrics_path = os.environ.get("POETICA_METRICS")
+    if metrics_path:
+        atexit.register(perf.dump, metrics_path)
     poems = load_or_scrape()
     if not poems:
         return
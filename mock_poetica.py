@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Serveur HTTP local imitant poetica.fr, pour tester / mesurer le crawler hors ligne.
+
+Pages générées à partir d'un corpus (poetica_poems.json ou generate_corpus.py),
+avec les sélecteurs attendus par main.py et json_content_filler.py :
+- /                          menus #menu-poemes-par-auteur et #menu-poemes-par-theme
+- /auteur/<slug>/[page/N/]   listings article.post + h2.entry-title a, pagination a[rel=next]
+- /theme/<slug>/             page de thème (vide, seulement pour les liens)
+- /poeme-NNN/<slug>/         .cat-links a (auteur + thèmes) et div.entry-content
+                             avec le marqueur <!--pstart -->
+
+Latence configurable (fixe + gigue) et injection d'erreurs (HTTP 503 aléatoires).
+Le serveur compte requêtes, octets, erreurs injectées, nouvelles tentatives du
+client (re‑demande d'une page en erreur) et téléchargements en double.
+
+Exécution (serveur seul) :
+  python mock_poetica.py --port 8000 --latency-ms 20 --error-rate 0.02
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+import unicodedata
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+
+LISTING_PAGE_SIZE = 20     # poèmes par page de listing (comme le site)
+CONTENT_LINES = 12         # vers générés par poème
+
+
+def slugify(s: str) -> str:
+    s = unicodedata.normalize("NFKD", s).encode("ascii", "ignore").decode().lower()
+    return re.sub(r"[^a-z0-9]+", "-", s).strip("-") or "x"
+
+
+class MockSite:
+    """Pages HTML générées à la demande à partir d'un corpus."""
+
+    def __init__(self, poems: List[Dict], seed: int = 0):
+        self.authors: Dict[str, Tuple[str, List[Dict]]] = {}  # slug -> (nom, poèmes)
+        self.display: Dict[str, str] = {}                     # slug -> nom d'affichage
+        self.themes: Dict[str, str] = {}                      # slug -> nom
+        self.poems: Dict[str, Tuple[str, Dict]] = {}          # /poeme-N/slug -> (slug auteur, poème)
+        for p in poems:
+            a_slug = slugify(p["author"])
+            self.authors.setdefault(a_slug, (p["author"], []))[1].append(p)
+            cats = p.get("categories", [])
+            if cats and a_slug not in self.display:
+                self.display[a_slug] = cats[0]
+            for c in cats[1:]:
+                self.themes.setdefault(slugify(c), c)
+            self.poems[self._path(p["url"])] = (a_slug, p)
+        self.seed = seed
+
+    @staticmethod
+    def _path(url: str) -> str:
+        path = urlsplit(url).path
+        return path[:-1] if path.endswith("/") else path
+
+    def _page(self, title: str, body: str) -> str:
+        return (
+            "<!DOCTYPE html><html><head><meta charset='utf-8'>"
+            f"<title>{escape(title)}</title></head><body>{body}</body></html>"
+        )
+
+    def home(self, base: str) -> str:
+        authors = "".join(
+            f"<li><a href='{base}auteur/{slug}/'>{escape(name)}</a></li>"
+            for slug, (name, _) in self.authors.items()
+        )
+        themes = "".join(
+            f"<li><a href='{base}theme/{slug}/'>{escape(name)}</a></li>"
+            for slug, name in self.themes.items()
+        )
+        return self._page("Poetica", (
+            f"<ul id='menu-poemes-par-auteur'>{authors}</ul>"
+            f"<ul id='menu-poemes-par-theme'>{themes}</ul>"
+        ))
+
+    def listing(self, base: str, a_slug: str, page: int) -> Optional[str]:
+        if a_slug not in self.authors:
+            return None
+        name, poems = self.authors[a_slug]
+        start = (page - 1) * LISTING_PAGE_SIZE
+        chunk = poems[start:start + LISTING_PAGE_SIZE]
+        if page > 1 and not chunk:
+            return None
+        articles = "".join(
+            "<article class='post'>"
+            f"<h2 class='entry-title'><a href='{base}{self._path(p['url'])[1:]}/'>{escape(p['title'])}</a></h2>"
+            f"<span class='comments-link'>{int(p.get('comments', 0))} commentaires</span>"
+            "</article>"
+            for p in chunk
+        )
+        nav = ""
+        if start + LISTING_PAGE_SIZE < len(poems):
+            nav = f"<a rel='next' class='next page-numbers' href='{base}auteur/{a_slug}/page/{page + 1}/'>Suivant</a>"
+        return self._page(name, articles + nav)
+
+    def theme(self, t_slug: str) -> Optional[str]:
+        if t_slug not in self.themes:
+            return None
+        return self._page(self.themes[t_slug], "")
+
+    def poem(self, base: str, path: str) -> Optional[str]:
+        if path not in self.poems:
+            return None
+        a_slug, p = self.poems[path]
+        links = [f"<a href='{base}auteur/{a_slug}/' rel='category'>{escape(self.display.get(a_slug, p['author']))}</a>"]
+        links += [
+            f"<a href='{base}theme/{slugify(c)}/' rel='category'>{escape(c)}</a>"
+            for c in p.get("categories", [])[1:]
+        ]
+        # contenu déterministe par poème
+        rng = random.Random(f"{self.seed}:{path}")
+        words = p["title"].split() or ["vers"]
+        stanzas = []
+        for _ in range(CONTENT_LINES // 4):
+            lines = [" ".join(rng.choices(words, k=rng.randint(4, 9))) for _ in range(4)]
+            stanzas.append("<p>" + "<br />".join(escape(l) for l in lines) + "</p>")
+        return self._page(p["title"], (
+            f"<h1 class='entry-title'>{escape(p['title'])}</h1>"
+            f"<div class='entry-content'><p><!--pstart --></p>{''.join(stanzas)}</div>"
+            f"<footer class='entry-footer'><span class='cat-links'>{''.join(links)}</span></footer>"
+        ))
+
+    def render(self, base: str, path: str) -> Optional[str]:
+        path = unquote(path.split("?", 1)[0])
+        if path in ("", "/"):
+            return self.home(base)
+        norm = path[:-1] if path.endswith("/") else path
+        m = re.fullmatch(r"/auteur/([^/]+)(?:/page/(\d+))?", norm)
+        if m:
+            return self.listing(base, m.group(1), int(m.group(2) or 1))
+        m = re.fullmatch(r"/theme/([^/]+)", norm)
+        if m:
+            return self.theme(m.group(1))
+        return self.poem(base, norm)
+
+
+class MockStats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.requests = 0
+        self.bytes = 0
+        self.errors_injected = 0
+        self.not_found = 0
+        self.retries = 0
+        self.duplicates = 0
+        self._seen: set[str] = set()
+        self._failed: set[str] = set()
+
+    def record(self, path: str, status: int, size: int):
+        with self.lock:
+            self.requests += 1
+            self.bytes += size
+            if status == 503:
+                self.errors_injected += 1
+            elif status == 404:
+                self.not_found += 1
+            # re‑demande après une erreur = nouvelle tentative du client ;
+            # re‑demande d'une page déjà servie = téléchargement en double
+            if path in self._failed:
+                self.retries += 1
+                self._failed.discard(path)
+            elif path in self._seen:
+                self.duplicates += 1
+            if status == 503:
+                self._failed.add(path)
+            else:
+                self._seen.add(path)
+
+    def as_dict(self) -> Dict[str, int]:
+        with self.lock:
+            return {
+                "requests": self.requests,
+                "bytes": self.bytes,
+                "errors_injected": self.errors_injected,
+                "not_found": self.not_found,
+                "retries": self.retries,
+                "duplicates": self.duplicates,
+            }
+
+
+class MockPoeticaServer:
+    """Serveur lancé dans un thread ; `base_url` est à substituer à main.BASE_URL."""
+
+    def __init__(self, poems: List[Dict], host: str = "127.0.0.1", port: int = 0,
+                 latency_ms: float = 0.0, jitter_ms: float = 0.0,
+                 error_rate: float = 0.0, seed: int = 0):
+        self.site = MockSite(poems, seed=seed)
+        self.stats = MockStats()
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.httpd.daemon_threads = True
+        self.base_url = f"http://{host}:{self.httpd.server_address[1]}/"
+        self._thread: Optional[threading.Thread] = None
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with server._rng_lock:
+                    delay = server.latency_ms + server._rng.uniform(0, server.jitter_ms)
+                    fail = server._rng.random() < server.error_rate
+                if delay > 0:
+                    time.sleep(delay / 1000.0)
+                if fail:
+                    status, html = 503, "<html><body>Service Unavailable</body></html>"
+                else:
+                    html = server.site.render(server.base_url, self.path)
+                    status = 200 if html is not None else 404
+                    if html is None:
+                        html = "<html><body>Not Found</body></html>"
+                body = html.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                server.stats.record(self.path, status, len(body))
+
+            def log_message(self, *_):
+                pass
+
+        return Handler
+
+    def start(self) -> "MockPoeticaServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *_):
+        self.stop()
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Faux poetica.fr local.")
+    ap.add_argument("--corpus", default="poetica_poems.json")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8000)
+    ap.add_argument("--latency-ms", type=float, default=0.0)
+    ap.add_argument("--jitter-ms", type=float, default=0.0)
+    ap.add_argument("--error-rate", type=float, default=0.0)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    with open(args.corpus, "r", encoding="utf-8") as f:
+        poems = json.load(f)
+    server = MockPoeticaServer(poems, args.host, args.port, args.latency_ms,
+                               args.jitter_ms, args.error_rate, args.seed)
+    print(f"[INFO] {len(poems)} poèmes servis sur {server.base_url} (Ctrl+C pour arrêter)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        print(json.dumps(server.stats.as_dict(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+Instrumentation légère : chronomètres, compteurs et histogrammes en mémoire.
+
+Usage :
+    import perf
+
+    with perf.timed("http.fetch"):
+        ...
+
+    @perf.timed("io.save")
+    def save_data(...): ...
+
+    perf.incr("http.bytes", len(body))
+    perf.dump("metrics.json")   # ou perf.snapshot() -> dict
+
+Le coût par mesure est de deux appels à time.perf_counter() et d'une mise à
+jour de dictionnaire sous verrou : on peut le laisser actif en permanence.
+Les durées sont stockées en millisecondes.
+
+Variables d'environnement (lues par main.py) :
+  POETICA_METRICS=chemin.json   écrit les métriques à la sortie du programme
+  POETICA_PROFILE=chemin.prof   profile (cProfile) le premier rafraîchissement
+"""
+from __future__ import annotations
+
+import bisect
+import cProfile
+import contextlib
+import io
+import json
+import pstats
+import threading
+import time
+from typing import Dict, Iterator, List, Optional
+
+# bornes supérieures des seaux (ms) ; le dernier seau est « au‑delà »
+BUCKETS_MS: List[float] = [0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000, 5000]
+
+_lock = threading.Lock()
+
+
+class Histogram:
+    __slots__ = ("count", "total", "min", "max", "last", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+        self.last = 0.0
+        self.buckets = [0] * (len(BUCKETS_MS) + 1)
+
+    def add(self, ms: float) -> None:
+        self.count += 1
+        self.total += ms
+        self.last = ms
+        if ms < self.min:
+            self.min = ms
+        if ms > self.max:
+            self.max = ms
+        self.buckets[bisect.bisect_left(BUCKETS_MS, ms)] += 1
+
+    def as_dict(self) -> Dict:
+        return {
+            "count": self.count,
+            "total_ms": self.total,
+            "mean_ms": self.total / self.count if self.count else 0.0,
+            "min_ms": self.min if self.count else 0.0,
+            "max_ms": self.max,
+            "last_ms": self.last,
+            "buckets": {
+                (f"<={b}" if i < len(BUCKETS_MS) else f">{BUCKETS_MS[-1]}"): n
+                for i, (b, n) in enumerate(zip(BUCKETS_MS + [None], self.buckets))
+                if n
+            },
+        }
+
+
+counters: Dict[str, int] = {}
+histograms: Dict[str, Histogram] = {}
+
+
+def incr(name: str, n: int = 1) -> None:
+    with _lock:
+        counters[name] = counters.get(name, 0) + n
+
+
+def observe(name: str, ms: float) -> None:
+    with _lock:
+        h = histograms.get(name)
+        if h is None:
+            h = histograms[name] = Histogram()
+        h.add(ms)
+
+
+class timed(contextlib.ContextDecorator):
+    """Chronomètre utilisable en `with` ou en décorateur ; alimente l'histogramme `name`."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._t0 = 0.0
+
+    def _recreate_cm(self):
+        # en décorateur : une instance par appel (réentrance, threads)
+        return timed(self.name)
+
+    def __enter__(self):
+        self._t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        observe(self.name, (time.perf_counter() - self._t0) * 1000.0)
+        return False
+
+
+def last_ms(name: str) -> float:
+    h = histograms.get(name)
+    return h.last if h else 0.0
+
+
+def snapshot() -> Dict:
+    with _lock:
+        return {
+            "counters": dict(counters),
+            "histograms": {k: h.as_dict() for k, h in histograms.items()},
+        }
+
+
+def reset() -> None:
+    with _lock:
+        counters.clear()
+        histograms.clear()
+
+
+def dump(path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(snapshot(), f, ensure_ascii=False, indent=2)
+
+
+@contextlib.contextmanager
+def profiled(path: Optional[str] = None, top: int = 25) -> Iterator[cProfile.Profile]:
+    """Profile le bloc avec cProfile ; écrit `path` (.prof, lisible par snakeviz /
+    pstats) et affiche les `top` fonctions les plus coûteuses (temps cumulé).
+    """
+    prof = cProfile.Profile()
+    prof.enable()
+    try:
+        yield prof
+    finally:
+        prof.disable()
+        if path:
+            prof.dump_stats(path)
+        out = io.StringIO()
+        pstats.Stats(prof, stream=out).sort_stats("cumulative").print_stats(top)
+        print(out.getvalue())
+
@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+"""
+Clés d'identification des poèmes, partagées par l'application (main.py) et les
+étapes hors ligne (dedup_poems.py) sans dépendre de Tk ni du réseau.
+"""
+import re
+
+POEM_ID_RE = re.compile(r"/poeme-(\d+)", re.I)
+
+
+def norm_url(u: str) -> str:
+    if not u:
+        return ""
+    u = u.strip()
+    if not u:
+        return ""
+    # retirer slash final et forcer minuscule
+    return u[:-1].lower() if u.endswith('/') else u.lower()
+
+
+def poem_key(url: str) -> str:
+    """Clé stable d'un poème : "poeme-NNN" extrait de l'URL (le slug peut varier),
+    à défaut l'URL normalisée."""
+    m = POEM_ID_RE.search(url or "")
+    return f"poeme-{m.group(1)}" if m else norm_url(url)
@@ -0,0 +1,72 @@
+"""Tests de l'identité des auteurs et de la fusion des jeux de données
+(main.author_key, AuthorIndex, merge_poems, clean_poems)."""
+from main import AuthorIndex, Poem, author_key, clean_poems, merge_poems
+
+
+def _poem(n, author="HUGO Victor", categories=(), comments=0, dup_cluster=None):
+    return Poem(f"Poème {n}", f"https://www.poetica.fr/poeme-{n}/slug-{n}/", comments,
+                author, list(categories), dup_cluster=dup_cluster)
+
+
+def test_author_key_matches_name_variants():
+    assert author_key("HUGO Victor") == author_key("Victor Hugo")
+    assert author_key("LA FONTAINE (de) Jean") == author_key("Jean de La Fontaine")
+    assert author_key("AGRIPPA D’AUBIGNÉ Théodore") == author_key("Théodore Agrippa d'Aubigné")
+    assert author_key("HUGO Victor") != author_key("HUGO Adèle")
+
+
+def test_author_index_resolves_variants_and_urls():
+    index = AuthorIndex()
+    aid = index.add("HUGO Victor", "https://www.poetica.fr/categories/victor-hugo/")
+    assert index.resolve("Victor Hugo") == aid
+    assert index.resolve(url="https://www.poetica.fr/categories/victor-hugo") == aid
+    assert index.canonical("Victor Hugo") == "HUGO Victor"
+    assert index.add("Victor Hugo") == aid
+    assert len(index) == 1
+
+
+def test_merge_poems_keeps_first_and_fills_empty_fields():
+    first = _poem(1, categories=[], comments=10)
+    # même poème (poeme-1) sous une autre URL / un autre slug
+    later = Poem("Autre titre", "https://www.poetica.fr/poeme-1/autre-slug/", 99,
+                 "Victor Hugo", ["Mort"], dup_cluster="poeme-1")
+    other = _poem(2, categories=["Amour"])
+    merged = merge_poems([[first, other], [later]])
+    assert merged == [first, other]
+    assert first.title == "Poème 1" and first.comments == 10
+    assert first.categories == ["Mort"]
+    assert first.dup_cluster == "poeme-1"
+
+
+def test_merge_poems_does_not_overwrite_filled_fields():
+    first = _poem(1, categories=["Amour"], dup_cluster="poeme-1")
+    later = _poem(1, categories=["Mort"], dup_cluster="poeme-9")
+    merge_poems([[first], [later]])
+    assert first.categories == ["Amour"]
+    assert first.dup_cluster == "poeme-1"
+
+
+def test_clean_poems_canonicalises_authors_and_strips_author_categories():
+    index = AuthorIndex()
+    poems = [
+        _poem(1, "HUGO Victor", ["Victor Hugo", "Famille", "Mort"]),
+        _poem(2, "Victor Hugo", ["Victor Hugo", "Tristesse"]),
+        # catégorie = autre auteur connu
+        _poem(3, "ELUARD Paul", ["Paul Eluard", "Victor Hugo", "Liberté"]),
+    ]
+    clean_poems(poems, index)
+    assert [p.author for p in poems] == ["HUGO Victor", "HUGO Victor", "ELUARD Paul"]
+    assert [p.categories for p in poems] == [["Famille", "Mort"], ["Tristesse"], ["Liberté"]]
+    assert len(index) == 2
+
+
+def test_clean_poems_ignores_empty_author():
+    index = AuthorIndex()
+    index.add("HUGO Victor")
+    index.dirty = False
+    poems = [_poem(1, "", ["Amour"]), _poem(2, "HUGO Victor", ["Mort"])]
+    clean_poems(poems, index)
+    assert not index.dirty
+    assert len(index) == 1
+    assert poems[0].author == "" and poems[0].categories == ["Amour"]
+    assert index.add("") is None
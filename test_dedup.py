@@ -0,0 +1,117 @@
+"""Tests de la détection de quasi-doublons (dedup_poems.py) et du filtre
+« Masquer les doublons » (main.drop_duplicates)."""
+import json
+import random
+
+import dedup_poems
+from main import Poem, apply_duplicates, drop_duplicates, filter_poems, load_duplicates, sort_poems
+
+
+def _poems():
+    # poeme-1 (représentant global, très commenté) et sa copie retitrée poeme-2
+    original = Poem("Le Lac", "https://www.poetica.fr/poeme-1/le-lac/", 500,
+                    "LAMARTINE Alphonse", ["Nature"], dup_cluster="poeme-1")
+    copy = Poem("Ô temps suspends ton vol", "https://www.poetica.fr/poeme-2/o-temps/", 3,
+                "LAMARTINE Alphonse", ["Le temps qui passe"], dup_cluster="poeme-1")
+    other = Poem("Liberté", "https://www.poetica.fr/poeme-3/liberte/", 50,
+                 "ELUARD Paul", ["Liberté"])
+    return original, copy, other
+
+
+def _view(base, q="", cats=(), hide=True):
+    data = filter_poems(base, q, list(cats))
+    sort_poems(data, "comments", True)
+    return drop_duplicates(data) if hide else data
+
+
+def test_hide_keeps_one_per_cluster():
+    original, copy, other = _poems()
+    assert _view([copy, other, original]) == [original, other]
+
+
+def test_hide_keeps_copy_when_title_filter_excludes_representative():
+    original, copy, other = _poems()
+    assert _view([original, copy, other], q="suspends") == [copy]
+
+
+def test_hide_keeps_copy_when_theme_filter_excludes_representative():
+    original, copy, other = _poems()
+    assert _view([original, copy, other], cats=["Le temps qui passe"]) == [copy]
+
+
+def test_hide_keeps_copy_when_it_is_the_only_base_poem():
+    _, copy, _ = _poems()
+    assert _view([copy]) == [copy]
+
+
+def test_minhash_similarity_tracks_overlap():
+    words = [f"mot{i}" for i in range(200)]
+    a = dedup_poems.minhash(dedup_poems.shingles(" ".join(words)))
+    b = dedup_poems.minhash(dedup_poems.shingles(" ".join(words[:195] + ["x"] * 5)))
+    c = dedup_poems.minhash(dedup_poems.shingles(" ".join(reversed(words))))
+    assert dedup_poems.similarity(a, a) == 1.0
+    assert dedup_poems.similarity(a, b) >= dedup_poems.SIMILARITY_THRESHOLD
+    assert dedup_poems.similarity(a, c) < 0.2
+
+
+def test_find_clusters_pairs_behind_dissimilar_first_member():
+    rows, n = dedup_poems.ROWS, dedup_poems.NUM_PERM
+    rng = random.Random(0)
+    band0 = [rng.getrandbits(64) for _ in range(rows)]
+    # A ne partage que la bande 0 avec B et C, et apparaît en premier dans le seau
+    a = band0 + [rng.getrandbits(64) for _ in range(n - rows)]
+    b = band0 + [rng.getrandbits(64) for _ in range(n - rows)]
+    # C = B sauf une valeur par bande restante : très similaires (≈ 0.88), mais
+    # aucune autre bande commune pour les rapprocher
+    c = list(b)
+    for band in range(1, dedup_poems.BANDS):
+        c[band * rows] = rng.getrandbits(64)
+    assert dedup_poems.similarity(b, c) >= dedup_poems.SIMILARITY_THRESHOLD
+
+    parent = dedup_poems.find_clusters([a, b, c])
+    roots = [dedup_poems.find(parent, i) for i in range(3)]
+    assert roots[1] == roots[2]
+    assert roots[0] != roots[1]
+
+
+def test_find_clusters_pairs_chained_members():
+    rows, n = dedup_poems.ROWS, dedup_poems.NUM_PERM
+    rng = random.Random(1)
+    # a, b, c ne partagent que la bande 0 ; a–b et b–c ≈ 0.88, a–c ≈ 0.77 :
+    # c doit rejoindre le cluster de a et b via sa ressemblance avec b
+    b = [rng.getrandbits(64) for _ in range(n)]
+    a, c = list(b), list(b)
+    for band in range(1, dedup_poems.BANDS):
+        a[band * rows] = rng.getrandbits(64)
+        c[band * rows + 1] = rng.getrandbits(64)
+    threshold = dedup_poems.SIMILARITY_THRESHOLD
+    assert dedup_poems.similarity(a, b) >= threshold
+    assert dedup_poems.similarity(b, c) >= threshold
+    assert dedup_poems.similarity(a, c) < threshold
+
+    parent = dedup_poems.find_clusters([a, b, c])
+    roots = {dedup_poems.find(parent, i) for i in range(3)}
+    assert len(roots) == 1
+
+
+def test_assign_clusters_marks_most_commented_member():
+    text = " ".join(f"vers{i}" for i in range(60))
+    poems = [
+        {"url": "https://www.poetica.fr/poeme-10/a/", "comments": 1, "content": text},
+        {"url": "https://www.poetica.fr/poeme-11/b/", "comments": 9, "content": text},
+        {"url": "https://www.poetica.fr/poeme-12/c/", "comments": 5, "content": "tout autre chose ici"},
+        {"url": "https://www.poetica.fr/poeme-13/d/", "comments": 0, "content": ""},
+    ]
+    assert dedup_poems.assign_clusters(poems) == (1, 1)
+    assert [p["dup_cluster"] for p in poems] == ["poeme-11", "poeme-11", None, None]
+
+
+def test_duplicates_side_file_sets_dup_cluster(tmp_path):
+    path = tmp_path / "poetica_duplicates.json"
+    path.write_text(json.dumps({"poeme-1": "poeme-1", "poeme-2": "poeme-1"}), encoding="utf-8")
+    original, copy, other = _poems()
+    for p in (original, copy):
+        p.dup_cluster = None
+    apply_duplicates([original, copy, other], load_duplicates(str(path)))
+    assert [p.dup_cluster for p in (original, copy, other)] == ["poeme-1", "poeme-1", None]
+    assert load_duplicates(str(tmp_path / "absent.json")) == {}
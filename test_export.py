@@ -0,0 +1,54 @@
+"""Tests de l'export en flux (main.iter_export_rows, main.export_rows)."""
+import csv
+import json
+
+import main
+from main import EXPORT_COLUMNS, EXPORT_HEADERS, Poem, export_format_for, export_rows, iter_export_rows
+
+
+def _poems():
+    return [
+        Poem("Le Lac", "https://www.poetica.fr/poeme-1/le-lac/", 500,
+             "LAMARTINE Alphonse", ["Nature", "Amour, toujours"]),
+        Poem("Liberté", "https://www.poetica.fr/poeme-3/liberte/", 50,
+             "ELUARD Paul", []),
+    ]
+
+
+def test_export_format_for_extension():
+    assert export_format_for("a.csv") == "csv"
+    assert export_format_for("a.JSONL") == "jsonl"
+    assert export_format_for("a.parquet") == "parquet"
+    assert export_format_for("a") == "csv"
+
+
+def test_csv_round_trip(tmp_path):
+    path = tmp_path / "export.csv"
+    assert export_rows(iter_export_rows(_poems()), str(path), "csv") == 2
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    assert rows == [
+        list(EXPORT_HEADERS),
+        ["500", "Le Lac", "LAMARTINE Alphonse", "Nature, Amour, toujours",
+         "https://www.poetica.fr/poeme-1/le-lac/"],
+        ["50", "Liberté", "ELUARD Paul", "", "https://www.poetica.fr/poeme-3/liberte/"],
+    ]
+
+
+def test_jsonl_round_trip_keeps_themes_as_list(tmp_path):
+    path = tmp_path / "export.jsonl"
+    assert export_rows(iter_export_rows(_poems()), str(path), "jsonl") == 2
+    with open(path, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+    assert [list(r) for r in records] == [list(EXPORT_COLUMNS)] * 2
+    assert records[0]["categories"] == ["Nature", "Amour, toujours"]
+    assert records[0]["comments"] == 500 and records[0]["title"] == "Le Lac"
+    assert records[1]["categories"] == []
+
+
+def test_export_reports_progress_per_batch(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "EXPORT_BATCH", 2)
+    poems = _poems() * 3
+    seen = []
+    export_rows(iter_export_rows(poems), str(tmp_path / "export.jsonl"), "jsonl", seen.append)
+    assert seen == [2, 4, 6]